@@ -0,0 +1,233 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+C-speed register dump parser, a drop-in for run_sandbox_job.parse_register_dump.
+
+Build in place (needs Cython 3 and a C compiler):
+    cythonize -i backend/parse_register_dump_c.pyx
+
+run_sandbox_job.py uses this module when it can import it and falls back to
+its pure-Python parser otherwise, so both must accept exactly the same lines
+and produce exactly the same dicts.
+"""
+from cpython.unicode cimport PyUnicode_DecodeASCII
+from libc.string cimport memchr, memcmp, memset
+
+# Same bits, names and order as run_sandbox_job._RFLAGS_BITS
+cdef tuple _RFLAGS_BITS = (
+    (0, "cf"),
+    (2, "pf"),
+    (4, "af"),
+    (6, "zf"),
+    (7, "sf"),
+    (8, "tf"),
+    (9, "if"),
+    (10, "df"),
+    (11, "of"),
+    (14, "nt"),
+    (16, "rf"),
+    (17, "vm"),
+    (18, "ac"),
+    (19, "vif"),
+    (20, "vip"),
+    (21, "id"),
+)
+
+cdef const char* _HEX_DIGITS = b"0123456789abcdef"
+cdef const char* _FLAGS = b"flags"
+
+# Hex digit value per byte, 0xff for non-hex bytes
+cdef unsigned char _NIBBLE[256]
+
+cdef void _init_nibbles() noexcept:
+    cdef int k
+    memset(_NIBBLE, 0xff, 256)
+    for k in range(10):
+        _NIBBLE[ord('0') + k] = k
+    for k in range(6):
+        _NIBBLE[ord('a') + k] = 10 + k
+        _NIBBLE[ord('A') + k] = 10 + k
+
+_init_nibbles()
+
+cdef inline bint _blank(char c) noexcept nogil:
+    return c == b' ' or c == b'\t'
+
+cdef inline bint _alpha(char c) noexcept nogil:
+    return (b'a' <= c <= b'z') or (b'A' <= c <= b'Z')
+
+cdef inline bint _digit(char c) noexcept nogil:
+    return b'0' <= c <= b'9'
+
+cdef inline bint _hexdigit(char c) noexcept nogil:
+    return _NIBBLE[<unsigned char>c] != 0xff
+
+cdef inline Py_ssize_t _skip_blanks(const char* s, Py_ssize_t i, Py_ssize_t end) noexcept nogil:
+    while i < end and _blank(s[i]):
+        i += 1
+    return i
+
+cdef inline Py_ssize_t _word(const char* s, Py_ssize_t i, Py_ssize_t end,
+                             const char* word, Py_ssize_t n, bint need_blank) noexcept nogil:
+    """
+    Index just past `word` at s[i] and the blanks after it, or -1 if the word
+    isn't there (or isn't followed by a blank when need_blank is set).
+    """
+    if i < 0 or end - i < n or memcmp(s + i, word, n) != 0:
+        return -1
+    i += n
+    if need_blank and (i >= end or not _blank(s[i])):
+        return -1
+    return _skip_blanks(s, i, end)
+
+cdef Py_ssize_t _header(const char* s, Py_ssize_t i, Py_ssize_t end, Py_ssize_t* digits_end) noexcept nogil:
+    """
+    Match `===[ \t]*Breakpoint[ \t]+at[ \t]+line[ \t]+(\d+)[ \t]*===` spanning
+    exactly s[i:end]. Returns the start of the digits (end in digits_end) or -1.
+    """
+    cdef Py_ssize_t k, d
+    k = _word(s, i, end, b"===", 3, False)
+    k = _word(s, k, end, b"Breakpoint", 10, True)
+    k = _word(s, k, end, b"at", 2, True)
+    k = _word(s, k, end, b"line", 4, True)
+    if k < 0:
+        return -1
+
+    d = k
+    while k < end and _digit(s[k]):
+        k += 1
+    if k == d:
+        return -1
+    digits_end[0] = k
+
+    k = _skip_blanks(s, k, end)
+    if _word(s, k, end, b"===", 3, False) != end:
+        return -1
+    return d
+
+cdef bint _register(const char* s, Py_ssize_t i, Py_ssize_t end,
+                    Py_ssize_t* name_end, Py_ssize_t* hex_start) noexcept nogil:
+    """
+    Match `[a-zA-Z][a-zA-Z0-9]{1,15}:[ \t]*0x0*([0-9a-fA-F]{1,16})` spanning
+    exactly s[i:end]; hex_start is set to the first significant digit.
+    """
+    cdef Py_ssize_t k = i, v
+    if k >= end or not _alpha(s[k]):
+        return False
+    k += 1
+    while k < end and (_alpha(s[k]) or _digit(s[k])):
+        k += 1
+    if not (2 <= k - i <= 16) or k >= end or s[k] != b':':
+        return False
+    name_end[0] = k
+
+    k = _skip_blanks(s, k + 1, end)
+    if end - k < 3 or s[k] != b'0' or s[k + 1] != b'x':
+        return False
+    k += 2
+    v = k
+    while k < end and _hexdigit(s[k]):
+        k += 1
+    if k != end:
+        return False
+
+    # Skip leading zeros (keeping one digit); the rest must fit in a u64
+    while v < end - 1 and s[v] == b'0':
+        v += 1
+    if end - v > 16:
+        return False
+    hex_start[0] = v
+    return True
+
+cdef inline unsigned long long _decode_hex(const char* s, Py_ssize_t i, Py_ssize_t end) noexcept nogil:
+    """Table decode of at most 16 already-validated hex digits."""
+    cdef unsigned long long u64 = 0
+    while i < end:
+        u64 = (u64 << 4) | _NIBBLE[<unsigned char>s[i]]
+        i += 1
+    return u64
+
+cdef bint _is_flags_name(const char* s, Py_ssize_t i, Py_ssize_t n) noexcept nogil:
+    """Case-insensitive `[re]?flags`."""
+    cdef Py_ssize_t k
+    cdef char c
+    if n == 6:
+        c = s[i] | 0x20
+        if c != b'r' and c != b'e':
+            return False
+        i += 1
+        n -= 1
+    if n != 5:
+        return False
+    for k in range(5):
+        if (s[i + k] | 0x20) != _FLAGS[k]:
+            return False
+    return True
+
+cdef dict _expand_register(unsigned long long u64, bint is_flags):
+    cdef char hex_buf[18]
+    cdef char pairs[23]
+    cdef char ascii_buf[8]
+    cdef unsigned char b
+    cdef int k, bit
+    cdef dict flags
+
+    hex_buf[0] = b'0'
+    hex_buf[1] = b'x'
+    for k in range(16):
+        hex_buf[17 - k] = _HEX_DIGITS[(u64 >> (4 * k)) & 0xf]
+
+    for k in range(8):
+        b = (u64 >> (8 * k)) & 0xff
+        pairs[3 * k] = _HEX_DIGITS[b >> 4]
+        pairs[3 * k + 1] = _HEX_DIGITS[b & 0xf]
+        if k < 7:
+            pairs[3 * k + 2] = b' '
+        ascii_buf[k] = <char>b if 32 <= b <= 126 else b'.'
+
+    entry = {
+        "hex": PyUnicode_DecodeASCII(hex_buf, 18, NULL),
+        "u64": u64,
+        "i64": <long long>u64,
+        "bytes_le": PyUnicode_DecodeASCII(pairs, 23, NULL),
+        "ascii_le": PyUnicode_DecodeASCII(ascii_buf, 8, NULL),
+    }
+    if is_flags:
+        flags = {}
+        for bit, name in _RFLAGS_BITS:
+            flags[name] = <int>((u64 >> bit) & 1)
+        entry["flags"] = flags
+    return entry
+
+cpdef list parse(bytes raw):
+    cdef const char* s = raw
+    cdef Py_ssize_t n = len(raw)
+    cdef Py_ssize_t pos = 0, end, i, d, digits_end = 0, name_end = 0, hex_start = 0
+    cdef const char* nl
+    cdef list breakpoints = []
+    cdef dict regs = None
+    cdef unsigned long long u64
+
+    while True:
+        nl = <const char*>memchr(s + pos, b'\n', n - pos)
+        end = (nl - s) if nl != NULL else n
+
+        # Trim the line the same way the regex's `^[ \t]*` ... `[ \t\r]*$` does
+        i = _skip_blanks(s, pos, end)
+        while end > i and (_blank(s[end - 1]) or s[end - 1] == b'\r'):
+            end -= 1
+
+        d = _header(s, i, end, &digits_end)
+        if d >= 0:
+            regs = {}
+            breakpoints.append({"line": int(raw[d:digits_end]), "registers": regs})
+        elif regs is not None and _register(s, i, end, &name_end, &hex_start):
+            u64 = _decode_hex(s, hex_start, end)
+            regs[PyUnicode_DecodeASCII(s + i, name_end - i, NULL)] = _expand_register(
+                u64, _is_flags_name(s, i, name_end - i)
+            )
+
+        if nl == NULL:
+            break
+        pos = (nl - s) + 1
+
+    return breakpoints
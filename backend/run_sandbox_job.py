@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import os
 import shutil
+import stat
+import struct
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
+import io
 import json
+import posixpath
 import re
-from typing import Any, Dict, List
+import tarfile
+from typing import Any, Dict, Iterator, List
+
+# Optional C parser (backend/parse_register_dump_c.pyx); built with
+# `cythonize -i backend/parse_register_dump_c.pyx`.
+try:
+    from parse_register_dump_c import parse as _parse_register_dump_c
+except ImportError:
+    _parse_register_dump_c = None
 
 class SandboxJobError(Exception):
     def __init__(self, stage: str, message: str, details: str | None = None):
@@ -16,15 +30,55 @@ class SandboxJobError(Exception):
         self.message = message
         self.details = details
 
-# Helper functions for multiple representations
-def u64_to_bytes_le(u64: int) -> bytes:
-    return u64.to_bytes(8, byteorder="little", signed=False)
+# Multiple representations of a register value (all C-level, no per-byte Python loop)
+_pack_u64_le = struct.Struct("<Q").pack
+
+# Printable ASCII maps to itself, everything else to "."
+_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 46 for c in range(256))
+
+def _expand_register(u64: int) -> Dict[str, Any]:
+    """All views of one register value, packing its bytes only once."""
+    b = _pack_u64_le(u64)
+    return {
+        "hex": f"0x{u64:016x}",
+        "u64": u64,
+        "i64": u64 - (1 << 64) if u64 >> 63 else u64,
+        "bytes_le": b.hex(" "),
+        "ascii_le": b.translate(_ASCII_TABLE).decode("latin1"),
+    }
 
-def bytes_to_hex_pairs(b: bytes) -> str:
-    return " ".join(f"{x:02x}" for x in b)
+# Compact encode() stays on the C encoder; indent=2 (and json.dump's chunked
+# iterencode) fall back to the pure-Python one.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
 
-def bytes_to_ascii(b: bytes) -> str:
-    return "".join(chr(x) if 32 <= x <= 126 else "." for x in b)
+def print_json(payload: dict) -> None:
+    """
+    Print payload as compact JSON. A lazy (non-list) "breakpoints" value is
+    streamed one breakpoint at a time instead of being materialized first.
+    """
+    write = sys.stdout.write
+    breakpoints = payload.get("breakpoints")
+    if breakpoints is None or isinstance(breakpoints, list):
+        write(_json_encode(payload))
+        write("\n")
+        return
+
+    write("{")
+    for i, (key, value) in enumerate(payload.items()):
+        if i:
+            write(",")
+        write(_json_encode(key))
+        write(":")
+        if key != "breakpoints":
+            write(_json_encode(value))
+            continue
+        write("[")
+        for j, bp in enumerate(value):
+            if j:
+                write(",")
+            write(_json_encode(bp))
+        write("]")
+    write("}\n")
 
 def make_error_payload(stage: str, message: str, details: str | None = None) -> dict:
     payload = {
@@ -38,8 +92,20 @@ def make_error_payload(stage: str, message: str, details: str | None = None) ->
         payload["error"]["details"] = details
     return payload
 
-_BP_RE = re.compile(r"^===\s*Breakpoint\s+at\s+line\s+(\d+)\s*===\s*$")
-_REG_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9]{1,15}):\s*(0x[0-9a-fA-F]+)\s*$")
+# One pass over the whole dump; m.lastindex says what matched, so no
+# Python-level classification runs per line. Anything else is gdb noise.
+# Values capture at most 16 significant hex digits (leading zeros and the 0x
+# prefix are skipped), so they always fit in a u64.
+_DUMP_RE = re.compile(
+    rb"^[ \t]*(?:"
+    rb"===[ \t]*Breakpoint[ \t]+at[ \t]+line[ \t]+(\d+)[ \t]*==="  # 1: header
+    rb"|((?i:[re]?flags)):[ \t]*0x0*([0-9a-fA-F]{1,16})"             # 2, 3: flags register
+    rb"|([a-zA-Z][a-zA-Z0-9]{1,15}):[ \t]*0x0*([0-9a-fA-F]{1,16})"   # 4, 5: other register
+    rb")[ \t\r]*$",
+    re.MULTILINE,
+)
+_DUMP_HEADER = 1
+_DUMP_FLAGS_REG = 3
 
 _RFLAGS_BITS = [
     (0, "cf"),
@@ -63,6 +129,9 @@ _RFLAGS_BITS = [
 def decode_rflags(u64: int) -> Dict[str, int]:
     return {name: (u64 >> bit) & 1 for bit, name in _RFLAGS_BITS}
 
+def decode_output(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
 def infer_pipeline_stage(logs: str) -> str:
     text = logs.lower()
 
@@ -85,56 +154,46 @@ def extract_error_line(logs: str) -> str | None:
             return s
     return None
 
-def parse_register_dump(raw: str) -> List[Dict[str, Any]]:
-    breakpoints: List[Dict[str, Any]] = []
+def iter_register_dump(raw: str | bytes) -> Iterator[Dict[str, Any]]:
+    """Yield each breakpoint block of the dump once it is complete."""
+    if isinstance(raw, str):
+        raw = raw.encode()
+
     current: Dict[str, Any] | None = None
+    current_regs: Dict[str, Any] = {}
 
-    for raw_line in raw.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
+    for m in _DUMP_RE.finditer(raw):
+        kind = m.lastindex
 
-        # Breakpoint header
-        m = _BP_RE.match(line)
-        if m:
-            # save previous block
+        # Breakpoint header: the previous block is done
+        if kind == _DUMP_HEADER:
             if current is not None:
-                breakpoints.append(current)
-
-            current = {"line": int(m.group(1)), "registers": {}}
+                yield current
+            current_regs = {}
+            current = {"line": int(m.group(1)), "registers": current_regs}
             continue
 
         # Register line (only if we're inside a breakpoint block)
-        m = _REG_RE.match(line)
-        if m and current is not None:
-            reg = m.group(1)
-            reg_l = reg.lower()
-            val_str = m.group(2)
-
-            u64 = int(val_str, 16)
-
-            # signed view
-            i64 = u64 - (1 << 64) if (u64 & (1 << 63)) else u64
+        if current is None:
+            continue
 
-            b = u64_to_bytes_le(u64)
+        reg, val_str = m.group(kind - 1, kind)
+        reg = reg.decode("ascii")
+        # int() on the bytes is the fastest u64 decode CPython offers here
+        u64 = int(val_str, 16)
 
-            current["registers"][reg] = {
-                "hex": f"0x{u64:016x}",
-                "u64": u64,
-                "i64": i64,
-                "bytes_le": bytes_to_hex_pairs(b),
-                "ascii_le": bytes_to_ascii(b),
-            }
+        entry = current_regs[reg] = _expand_register(u64)
 
-            if reg_l in {"rflags", "eflags", "flags"}:
-                current["registers"][reg]["flags"] = decode_rflags(u64)
-            continue
+        if kind == _DUMP_FLAGS_REG:
+            entry["flags"] = decode_rflags(u64)
 
-        # ignore everything else (gdb noise)
     if current is not None:
-        breakpoints.append(current)
+        yield current
 
-    return breakpoints
+def parse_register_dump(raw: str | bytes) -> List[Dict[str, Any]]:
+    if _parse_register_dump_c is not None:
+        return _parse_register_dump_c(raw.encode() if isinstance(raw, str) else raw)
+    return list(iter_register_dump(raw))
 
 def sh(
     cmd: list[str],
@@ -159,6 +218,215 @@ def ensure_docker_available() -> None:
     except Exception as e:
         raise SandboxJobError("docker_check", "Docker does not seem to be available or working.", details=str(e))
 
+# Bind-mount work dirs and kept job dirs share one root, so dirs left behind
+# by crashed runs are found and pruned on the next startup. Work dirs are
+# named after the pid that owns them and are only pruned once it is gone:
+# another runner may still be using them, however old they are.
+# The root sits in the shared temp dir, so it is per-user and private, and
+# only created (and checked) on first use, never at import.
+_JOB_ROOT = Path(tempfile.gettempdir()) / f"slait_jobs-{os.getuid()}"
+_STALE_JOB_SECONDS = 60 * 60
+_WORK_DIR_RE = re.compile(r"work_(\d+)_")
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but isn't ours (EPERM)
+        return True
+    return True
+
+def job_root() -> Path:
+    """
+    Create the job root if needed and return it, refusing anything but a
+    real directory owned by us with no group/other access (e.g. a dir or
+    symlink another user planted under the same name).
+    """
+    try:
+        _JOB_ROOT.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        raise SandboxJobError("tmp_dir", f"Could not create {_JOB_ROOT}.", str(e))
+    st = os.lstat(_JOB_ROOT)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.geteuid() or st.st_mode & 0o077:
+        raise SandboxJobError(
+            "tmp_dir",
+            f"Refusing to use {_JOB_ROOT}: it must be a directory owned by the current user with mode 0700.",
+        )
+    return _JOB_ROOT
+
+def prune_stale_job_dirs(max_age: float = _STALE_JOB_SECONDS) -> None:
+    """
+    Remove kept job dirs not touched in `max_age` seconds, and work dirs whose
+    owning process has exited.
+    """
+    cutoff = time.time() - max_age
+    try:
+        entries = list(job_root().iterdir())
+    except (OSError, SandboxJobError):
+        # Nothing we can safely prune; run_job reports an unusable root.
+        return
+    for entry in entries:
+        try:
+            if entry.name.startswith("job_"):
+                stale = entry.stat().st_mtime < cutoff
+            else:
+                m = _WORK_DIR_RE.match(entry.name)
+                stale = m is not None and not _pid_alive(int(m.group(1)))
+            if stale:
+                shutil.rmtree(entry, ignore_errors=True)
+        except OSError:
+            continue
+
+def start_container(image: str, quiet: bool = False, work_dir: Path | None = None) -> str:
+    # Create container (not started yet). Uses a long sleep so we can docker exec.
+    mount = ["-v", f"{work_dir}:/work"] if work_dir is not None else []
+    create = sh(
+        ["docker", "create", *mount, image, "bash", "-lc", "sleep infinity"],
+        capture=True,
+        text=False,
+        check=True,
+    )
+    # Only the container id is ever decoded
+    cid = create.stdout.strip().decode("ascii", errors="replace")
+    if not cid:
+        raise SandboxJobError("docker_create", "Failed to create container (no container id returned).")
+
+    try:
+        sh(["docker", "start", cid], check=True, quiet=quiet)
+    except Exception:
+        sh(["docker", "rm", "-f", cid], check=False, capture=True, text=False)
+        raise
+    return cid
+
+def make_bind_dir() -> Path:
+    work_dir = Path(tempfile.mkdtemp(prefix=f"work_{os.getpid()}_", dir=job_root()))
+    # The sandbox user's uid usually differs from ours and must write outputs
+    # here, hence 0777. That is only safe because job_root() is 0700: other
+    # host users can't reach this dir to read inputs or swap outputs, while
+    # the container sees it as a bind mount without traversing its parents.
+    work_dir.chmod(0o777)
+    return work_dir
+
+def remove_container(cid: str) -> None:
+    sh(["docker", "rm", "-f", cid], check=False, capture=True, text=False)
+
+# Files the pipeline is expected to leave in /work
+_JOB_OUTPUTS = ("program_output.txt", "register_dump.txt")
+
+def copy_inputs_to_dir(work_dir: Path, files: Dict[str, Path]) -> None:
+    """
+    Bind mode: inputs go straight into the host dir mounted at /work.
+    The sandbox can write to that dir, so never follow or overwrite an entry
+    already there (a planted symlink would redirect our write on the host).
+    """
+    for name, path in files.items():
+        try:
+            # World-readable so the sandbox user can read it regardless of host mode.
+            fd = os.open(work_dir / name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o644)
+            with os.fdopen(fd, "wb") as dst, path.open("rb") as src:
+                shutil.copyfileobj(src, dst)
+        except OSError as e:
+            raise SandboxJobError("copy_inputs", "Failed to copy inputs into the work dir.", str(e))
+
+def read_outputs_from_dir(work_dir: Path) -> Dict[str, bytes]:
+    """
+    Bind mode: outputs are already on the host; returns the ones that exist.
+    Only regular files count: symlinks aren't followed (they could point at
+    any host file we can read) and FIFOs or devices aren't read from.
+    """
+    found: Dict[str, bytes] = {}
+    for name in _JOB_OUTPUTS:
+        try:
+            fd = os.open(work_dir / name, os.O_RDONLY | os.O_NOFOLLOW | os.O_NONBLOCK)
+        except OSError:
+            continue
+        with os.fdopen(fd, "rb") as f:
+            if stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+                found[name] = f.read()
+    return found
+
+def copy_inputs_to_container(cid: str, files: Dict[str, Path]) -> None:
+    """Copy host files into /work as one tar stream (a single `docker cp`)."""
+    proc = subprocess.Popen(
+        ["docker", "cp", "-", f"{cid}:/work"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+            for name, path in files.items():
+                info = tar.gettarinfo(str(path), arcname=name)
+                # World-readable so the sandbox user can read it regardless of host mode.
+                info.mode = 0o644
+                info.uid = info.gid = 0
+                info.uname = info.gname = ""
+                with path.open("rb") as f:
+                    tar.addfile(info, f)
+    except BrokenPipeError:
+        # docker cp exited early; its stderr below says why.
+        pass
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    err = proc.stderr.read()
+    proc.stderr.close()
+    if proc.wait() != 0:
+        raise SandboxJobError(
+            "docker_cp",
+            "Failed to copy inputs into the container.",
+            decode_output(err),
+        )
+
+# No-bind mode: run the pipeline with its output sent to stderr, then tar the
+# outputs to stdout in the same exec, keeping the pipeline's exit status. The
+# outputs arrive as soon as the pipeline ends, with no second exec or copy.
+# tar still archives whichever outputs exist when one is missing; its
+# complaint about the missing file is discarded and reported by the caller.
+_PIPELINE_THEN_TAR = (
+    'rc=0; "$@" >&2 || rc=$?; '
+    f'tar -cf - -C /work {" ".join(_JOB_OUTPUTS)} 2>/dev/null; '
+    'exit "$rc"'
+)
+
+def read_outputs_from_tar(data: bytes) -> Dict[str, bytes]:
+    """Extract the pipeline outputs from a tar archive; returns the ones found."""
+    found: Dict[str, bytes] = {}
+    try:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r|") as tar:
+            for member in tar:
+                name = posixpath.normpath(member.name)
+                if name not in _JOB_OUTPUTS or not member.isfile():
+                    continue
+                f = tar.extractfile(member)
+                if f is None:
+                    continue
+                found[name] = f.read()
+    except tarfile.ReadError:
+        # Empty or truncated stream (e.g. no outputs at all); report what we have.
+        pass
+    return found
+
+def missing_output_error(name: str, logs_raw: bytes) -> SandboxJobError:
+    logs = decode_output(logs_raw)
+    stage = infer_pipeline_stage(logs)
+    err_line = extract_error_line(logs)
+    message = f"Pipeline did not produce /work/{name} inside the container."
+    if err_line:
+        message = f"{message} {err_line}"
+    return SandboxJobError(
+        stage,
+        message,
+        f"--- Docker logs ---\n{logs}",
+    )
+
 def run_job(
     image: str,
     asm_path: Path,
@@ -166,126 +434,136 @@ def run_job(
     pipeline_cmd: list[str],
     keep_tmp: bool = False,
     json_only: bool = False,
-) -> tuple[str, str, str, dict]:
+    include_raw: bool = False,
+    bind: bool = True,
+    stream_breakpoints: bool = False,
+) -> tuple[str, str | None, bytes, dict]:
     """
-    Returns (stdout_text, register_dump_text, docker_logs_text).
+    Returns (stdout_text, register_dump_text, docker_logs, payload).
+    docker_logs is the raw combined exec output as bytes; it is only decoded
+    when building an error message. register_dump_text is None with
+    stream_breakpoints and not include_raw, where nothing needs the decoded
+    dump.
+
+    With bind=True (default) the container's /work is a bind-mounted host dir,
+    so no copy in or out happens; bind=False copies via tar streams instead,
+    for setups (e.g. Docker-in-Docker) where host paths aren't visible to the
+    daemon.
+
+    Every job gets a freshly started container that is removed afterwards;
+    nothing a job leaves behind (processes, /tmp, /app) reaches another job.
+
+    payload["breakpoints"] is a list unless stream_breakpoints is set (and no
+    C parser is built), in which case it is a one-shot iterator meant to be
+    streamed by print_json.
     """
     if not asm_path.exists():
         raise FileNotFoundError(f"ASM file not found: {asm_path}")
     if not lines_path.exists():
         raise FileNotFoundError(f"lines.txt file not found: {lines_path}")
 
-    tmp_dir = Path(tempfile.mkdtemp(prefix="slait_job_"))
-    out_dir = tmp_dir / "out"
-    out_dir.mkdir(parents=True, exist_ok=True)
-
+    files = {"program.asm": asm_path, "lines.txt": lines_path}
+    found: Dict[str, bytes] = {}
+    work_dir = None
     cid = None
-    logs = ""
+    logs = b""
 
     try:
-        # Create container (not started yet). Uses a long sleep so we can docker exec.
-        create = sh(
-            ["docker", "create", image, "bash", "-lc", "sleep infinity"],
-            capture=True,
-            check=True,
-        )
-        cid = create.stdout.strip()
-        if not cid:
-            raise SandboxJobError("docker_create", "Failed to create container (no container id returned).")
-
-        # Start it
-        sh(["docker", "start", cid], check=True, quiet=json_only)
+        # Start a fresh container, with /work bind-mounted from a host dir
+        # unless copying in and out instead
+        if bind:
+            work_dir = make_bind_dir()
+        cid = start_container(image, quiet=json_only, work_dir=work_dir)
 
         # Copy inputs into container
-        sh(["docker", "cp", str(asm_path), f"{cid}:/work/program.asm"], check=True, quiet=json_only)
-        sh(["docker", "cp", str(lines_path), f"{cid}:/work/lines.txt"], check=True, quiet=json_only)
-
-        # Run pipeline inside container (capture logs)
-        exec_res = sh(["docker", "exec", cid, *pipeline_cmd], check=False, capture=True)
-        logs = (exec_res.stdout or "") + ("\n" if exec_res.stdout else "") + (exec_res.stderr or "")
-
-        if exec_res.returncode != 0:
-            # Try to fetch any partial outputs anyway for debugging
-            # (docker cp will fail if file doesn't exist)
-            pass
-
-        # Copy outputs out (expected locations inside container)
-        # If either is missing, it'll raise with a helpful message.
-        prog_out_host = out_dir / "program_output.txt"
-        reg_out_host = out_dir / "register_dump.txt"
-
-        try:
-            sh(["docker", "cp", f"{cid}:/work/program_output.txt", str(prog_out_host)], check=True, quiet=json_only)
-        except Exception:
-            stage = infer_pipeline_stage(logs)
-            err_line = extract_error_line(logs)
-            message = "Pipeline did not produce /work/program_output.txt inside the container."
-            if err_line:
-                message = f"{message} {err_line}"
-            raise SandboxJobError(
-                stage,
-                message,
-                f"--- Docker logs ---\n{logs}",
-            )
-
-        try:
-            sh(["docker", "cp", f"{cid}:/work/register_dump.txt", str(reg_out_host)], check=True, quiet=json_only)
-        except Exception:
-            stage = infer_pipeline_stage(logs)
-            err_line = extract_error_line(logs)
-            message = "Pipeline did not produce /work/register_dump.txt inside the container."
-            if err_line:
-                message = f"{message} {err_line}"
-            raise SandboxJobError(
-                stage,
-                message,
-                f"--- Docker logs ---\n{logs}",
+        if work_dir is not None:
+            copy_inputs_to_dir(work_dir, files)
+        else:
+            copy_inputs_to_container(cid, files)
+
+        # Run pipeline inside container (capture logs), and collect outputs
+        # (expected locations inside container) even after a non-zero exit so
+        # partial outputs are available for debugging.
+        if work_dir is not None:
+            exec_res = sh(["docker", "exec", cid, *pipeline_cmd], check=False, capture=True, text=False)
+            logs = (exec_res.stdout or b"") + (b"\n" if exec_res.stdout else b"") + (exec_res.stderr or b"")
+            found = read_outputs_from_dir(work_dir)
+        else:
+            exec_res = sh(
+                ["docker", "exec", cid, "bash", "-c", _PIPELINE_THEN_TAR, "bash", *pipeline_cmd],
+                check=False,
+                capture=True,
+                text=False,
             )
+            logs = exec_res.stderr or b""
+            found = read_outputs_from_tar(exec_res.stdout or b"")
 
-        stdout_text = prog_out_host.read_text(errors="replace")
-        reg_text = reg_out_host.read_text(errors="replace")
-
-        breakpoints = parse_register_dump(reg_text)
+        # If either is missing, it'll raise with a helpful message.
+        for name in _JOB_OUTPUTS:
+            if name not in found:
+                raise missing_output_error(name, logs)
+
+        # Hand the parser the raw dump so it doesn't re-encode the decoded text.
+        reg_raw = found["register_dump.txt"]
+        stdout_text = decode_output(found["program_output.txt"])
+        reg_text = None if stream_breakpoints and not include_raw else decode_output(reg_raw)
+
+        # The C parser beats streaming, so only stream the pure-Python one
+        if stream_breakpoints and _parse_register_dump_c is None:
+            breakpoints = iter_register_dump(reg_raw)
+        else:
+            breakpoints = parse_register_dump(reg_raw)
 
-        
         payload = {
             "ok": True,
             "stdout": stdout_text,
             "breakpoints": breakpoints,
-           ## "raw_register_dump": reg_text,  # keep for debugging; can remove later
             "metadata": {
                 "image": image,
             },
-        }       
+        }
+        if include_raw:
+            # Debugging aid only: duplicates the whole dump in the payload.
+            payload["raw_register_dump"] = reg_text
 
 
         if exec_res.returncode != 0:
-            stage = infer_pipeline_stage(logs)
-            err_line = extract_error_line(logs)
+            logs_text = decode_output(logs)
+            stage = infer_pipeline_stage(logs_text)
+            err_line = extract_error_line(logs_text)
+            if reg_text is None:
+                reg_text = decode_output(reg_raw)
             message = f"Pipeline returned non-zero exit code: {exec_res.returncode}"
             if err_line:
                 message = f"{message}. {err_line}"
             raise SandboxJobError(
                 stage,
                 message,
-                f"docker_logs:\n{logs}\n\nprogram_output:\n{stdout_text}\n\nregister_dump:\n{reg_text}",
+                f"docker_logs:\n{logs_text}\n\nprogram_output:\n{stdout_text}\n\nregister_dump:\n{reg_text}",
             )
 
         return stdout_text, reg_text, logs, payload
 
     finally:
-        # Always cleanup container
+        # Always clean up the container and its work dir
         if cid:
-            try:
-                sh(["docker", "rm", "-f", cid], check=False, capture=True, quiet=json_only)
-            except Exception:
-                pass
+            remove_container(cid)
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
-        # Cleanup temp outputs unless you want to keep them
-        if not keep_tmp:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
-        else:
-            print(f"[SLAIT] Kept temp dir: {tmp_dir}", file=sys.stderr)
+        # Keep a copy of whatever outputs were produced if asked to
+        if keep_tmp:
+            try:
+                tmp_dir = Path(tempfile.mkdtemp(prefix="job_", dir=job_root()))
+            except SandboxJobError as e:
+                # Don't mask the job's own result or error
+                print(f"[SLAIT] Could not keep temp dir: {e.message}", file=sys.stderr)
+            else:
+                out_dir = tmp_dir / "out"
+                out_dir.mkdir(parents=True, exist_ok=True)
+                for name, data in found.items():
+                    (out_dir / name).write_bytes(data)
+                print(f"[SLAIT] Kept temp dir: {tmp_dir}", file=sys.stderr)
 
 
 def main() -> int:
@@ -295,9 +573,12 @@ def main() -> int:
     parser.add_argument("--lines", required=True, help="Path to lines.txt on host")
     parser.add_argument("--keep-tmp", action="store_true", help="Keep temp output directory for debugging")
     parser.add_argument("--json", action="store_true", help="Output JSON only")
+    parser.add_argument("--include-raw", action="store_true", help="Include the raw register dump in JSON output (debugging)")
+    parser.add_argument("--no-bind", action="store_true", help="Copy files in/out of the container instead of bind-mounting /work (e.g. Docker-in-Docker)")
     args = parser.parse_args()
 
     ensure_docker_available()
+    prune_stale_job_dirs()
 
     asm_path = Path(args.asm).resolve()
     lines_path = Path(args.lines).resolve()
@@ -313,17 +594,20 @@ def main() -> int:
             pipeline_cmd=pipeline_cmd,
             keep_tmp=args.keep_tmp,
             json_only=args.json,
+            include_raw=args.include_raw,
+            stream_breakpoints=args.json and not args.include_raw,
+            bind=not args.no_bind,
         )
     except FileNotFoundError as e:
         if args.json:
-            print(json.dumps(make_error_payload("input_validation", str(e)), indent=2))
+            print_json(make_error_payload("input_validation", str(e)))
         else:
             print(f"[SLAIT] ERROR (input_validation): {e}", file=sys.stderr)
         return 1
 
     except SandboxJobError as e:
         if args.json:
-            print(json.dumps(make_error_payload(e.stage, e.message, e.details), indent=2))
+            print_json(make_error_payload(e.stage, e.message, e.details))
         else:
             print(f"[SLAIT] ERROR ({e.stage}): {e.message}", file=sys.stderr)
             if e.details:
@@ -332,13 +616,13 @@ def main() -> int:
 
     except Exception as e:
         if args.json:
-            print(json.dumps(make_error_payload("unknown", str(e)), indent=2))
+            print_json(make_error_payload("unknown", str(e)))
         else:
             print(f"[SLAIT] ERROR: {e}", file=sys.stderr)
         return 1
 
     if args.json:
-        print(json.dumps(payload, indent=2))
+        print_json(payload)
     else:
         print("===== program_output.txt =====")
         print(stdout_text.rstrip("\n"))
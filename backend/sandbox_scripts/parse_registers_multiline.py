@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
+import hashlib
+import re
 import sys
 import subprocess
 from pathlib import Path
 import os 
 
+# "line:<N>" followed by an optional ", reg:flag, ..." tail
+_CFG_RE = re.compile(r"line:\s*(\d+)\s*(?:,(.*))?$")
+# A "reg:1" item in the tail; anchored to item boundaries so "rax:10" or "rax:1:0" don't count
+_REG_TOKEN = re.compile(r"(?:^|,)\s*([^,:\s][^,:]*?)\s*:\s*1\s*(?=,|$)")
+
 def parse_config_line(raw: str):
     """
     Input example:
@@ -11,25 +18,16 @@ def parse_config_line(raw: str):
     Returns:
       (line_number:int, tracked_registers:list[str])
     """
-    parts = [p.strip() for p in raw.split(",") if p.strip()]
-    if not parts or not parts[0].startswith("line:"):
-        raise ValueError(f"Bad config line (missing line:...): {raw!r}")
-
-    line_str = parts[0].split(":", 1)[1].strip()
-    if not line_str.isdigit():
+    # Leading empty items (", line:9") are tolerated
+    head = raw.strip().lstrip(", \t")
+    m = _CFG_RE.match(head)
+    if not m:
+        if not head.startswith("line:"):
+            raise ValueError(f"Bad config line (missing line:...): {raw!r}")
         raise ValueError(f"Bad line number in: {raw!r}")
 
-    line_no = int(line_str)
-
-    tracked = []
-    for item in parts[1:]:
-        if ":" not in item:
-            continue
-        reg, flag = item.split(":", 1)
-        reg = reg.strip()
-        flag = flag.strip()
-        if flag == "1":
-            tracked.append(reg)
+    line_no = int(m.group(1))
+    tracked = _REG_TOKEN.findall(m.group(2) or "")
     return line_no, tracked
 
 def load_lines_config(lines_path: Path):
@@ -44,48 +42,73 @@ def load_lines_config(lines_path: Path):
         raise ValueError("lines.txt contained no valid config lines.")
     return configs
 
+GDB_SCRIPT = "inspect.gdb"
+_KEY_PREFIX = "# slait-key: "
+# Bump whenever generate_gdb_script's output changes, so older cached
+# scripts for the same inputs are regenerated instead of reused.
+_GDB_SCRIPT_FORMAT = 1
+
+def gdb_script_key(configs, binary_path: str, out_path: str) -> str:
+    """Hash of everything that goes into the generated script, and its format."""
+    return hashlib.sha1(repr((_GDB_SCRIPT_FORMAT, binary_path, out_path, configs)).encode()).hexdigest()
+
+def gdb_script_is_current(key: str) -> bool:
+    """True if inspect.gdb already exists and was generated for `key`."""
+    try:
+        with open(GDB_SCRIPT) as f:
+            return f.readline().rstrip("\n") == f"{_KEY_PREFIX}{key}"
+    except OSError:
+        return False
+
 def generate_gdb_script(configs, binary_path: str, out_path: str):
-    with open("inspect.gdb", "w") as f:
-        f.write("set pagination off\n")
-        f.write("set confirm off\n")
-        f.write(f"set logging file {out_path}\n")
-        f.write("set logging overwrite on\n")
-        f.write("set logging enabled on\n")
-        f.write("set verbose off\n")
-        f.write("set complaints 0\n") #testing
-        f.write("set print thread-events off\n") #testing
-        f.write(f"file {binary_path}\n\n")
-
-        # Create breakpoints first
-        for (line_no, _) in configs:
-            f.write(f"break {line_no}\n")
-        f.write("\n")
-
-        # Attach commands to each breakpoint (1-indexed in creation order)
-        for idx, (line_no, tracked_regs) in enumerate(configs, start=1):
-            f.write(f"commands {idx}\n")
-            f.write(f'  echo \\n=== Breakpoint at line {line_no} ===\\n\n')
-            if tracked_regs:
-                for reg in tracked_regs:
-                    reg_l = reg.lower()
-
-                    # GDB consistently exposes the flags register as $eflags.
-                    if reg_l in {"rflags", "eflags", "flags"}:
-                        gdb_expr = "$eflags"
-                    else:
-                        gdb_expr = f"${reg}"
-
-                    f.write(f'  printf "{reg}: 0x%016lx\\n", {gdb_expr}\n') ## changed to hex representation for better readability
-            else:
-                f.write('  echo (No registers selected)\\n\n')
-            f.write("  continue\n")
-            f.write("end\n\n")
-
-        f.write("run\n")
-        f.write("quit\n")
+    # Build the whole script in memory and write it once
+    parts: list[str] = []
+    append = parts.append
+
+    # Header comment (ignored by gdb) lets later runs reuse the script
+    append(f"{_KEY_PREFIX}{gdb_script_key(configs, binary_path, out_path)}\n")
+    append("set pagination off\n")
+    append("set confirm off\n")
+    append(f"set logging file {out_path}\n")
+    append("set logging overwrite on\n")
+    append("set logging enabled on\n")
+    append("set verbose off\n")
+    append("set complaints 0\n") #testing
+    append("set print thread-events off\n") #testing
+    append(f"file {binary_path}\n\n")
+
+    # Create breakpoints first
+    for (line_no, _) in configs:
+        append(f"break {line_no}\n")
+    append("\n")
+
+    # Attach commands to each breakpoint (1-indexed in creation order)
+    for idx, (line_no, tracked_regs) in enumerate(configs, start=1):
+        append(f"commands {idx}\n")
+        append(f'  echo \\n=== Breakpoint at line {line_no} ===\\n\n')
+        if tracked_regs:
+            for reg in tracked_regs:
+                reg_l = reg.lower()
+
+                # GDB consistently exposes the flags register as $eflags.
+                if reg_l in {"rflags", "eflags", "flags"}:
+                    gdb_expr = "$eflags"
+                else:
+                    gdb_expr = f"${reg}"
+
+                append(f'  printf "{reg}: 0x%016lx\\n", {gdb_expr}\n') ## changed to hex representation for better readability
+        else:
+            append('  echo (No registers selected)\\n\n')
+        append("  continue\n")
+        append("end\n\n")
+
+    append("run\n")
+    append("quit\n")
+
+    Path(GDB_SCRIPT).write_text("".join(parts))
 
 def run_gdb(binary_path: str, out_path: str):
-    subprocess.run(["gdb", "-q", "-batch", "-x", "inspect.gdb"], check=False)
+    subprocess.run(["gdb", "-q", "-batch", "-x", GDB_SCRIPT], check=False)
 
 def main():
     if len(sys.argv) < 4:
@@ -98,9 +121,6 @@ def main():
 
     if os.path.exists(out_path):
         os.remove(out_path)
-    if os.path.exists("inspect.gdb"):
-        os.remove("inspect.gdb")
-
 
     if not lines_path.exists():
         print(f"ERROR: lines file not found: {lines_path}")
@@ -112,7 +132,11 @@ def main():
         print(f"ERROR parsing lines file: {e}")
         sys.exit(3)
 
-    generate_gdb_script(configs, binary_path, out_path)
+    # Skip regeneration when inspect.gdb was built from the same inputs. This
+    # only helps direct re-runs in one dir: run_pipeline.sh builds in a fresh
+    # /tmp/slait_build_* dir in a single-use container, so it never hits.
+    if not gdb_script_is_current(gdb_script_key(configs, binary_path, out_path)):
+        generate_gdb_script(configs, binary_path, out_path)
     run_gdb(binary_path, out_path)
 
 if __name__ == "__main__":